@@ -1,6 +1,7 @@
 import warnings
 from dataclasses import asdict, dataclass
 from io import BytesIO
+from itertools import islice
 from math import sqrt
 from pathlib import Path
 from subprocess import PIPE, run
@@ -8,8 +9,8 @@ from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple, Un
 
 import numpy as np
 
-from lhotse.utils import (Decibels, JsonMixin, Pathlike, Seconds, SetContainingAnything, YamlMixin, fastcopy,
-                          split_sequence)
+from lhotse.utils import (Decibels, JsonMixin, JsonlMixin, Pathlike, Seconds, SetContainingAnything, YamlMixin,
+                          fastcopy, split_sequence)
 
 Channels = Union[int, List[int]]
 
@@ -218,7 +219,7 @@ class Recording:
 
 
 @dataclass
-class RecordingSet(JsonMixin, YamlMixin, Sequence[Recording]):
+class RecordingSet(JsonMixin, JsonlMixin, YamlMixin, Sequence[Recording]):
     """
     RecordingSet represents a dataset of recordings. It does not contain any annotation -
     just the information needed to retrieve a recording (possibly multi-channel, from files
@@ -238,7 +239,10 @@ class RecordingSet(JsonMixin, YamlMixin, Sequence[Recording]):
         return RecordingSet.from_recordings(Recording.from_dict(raw_rec) for raw_rec in data)
 
     def to_dicts(self) -> List[dict]:
-        return [asdict(r) for r in self]
+        return list(self._iter_dicts())
+
+    def _iter_dicts(self) -> Iterable[dict]:
+        return (asdict(r) for r in self)
 
     def filter(self, predicate: Callable[[Recording], bool]) -> 'RecordingSet':
         """
@@ -296,8 +300,9 @@ class RecordingSet(JsonMixin, YamlMixin, Sequence[Recording]):
     def __getitem__(self, recording_id_or_index: Union[int, str]) -> Recording:
         if isinstance(recording_id_or_index, str):
             return self.recordings[recording_id_or_index]
-        # ~100x faster than list(dict.values())[index] for 100k elements
-        return next(val for idx, val in enumerate(self.recordings.values()) if idx == recording_id_or_index)
+        # Much faster than list(dict.values())[index] or an enumerate() scan for 100k elements,
+        # as islice skips the preceding items without materializing or comparing them in Python
+        return next(islice(self.recordings.values(), recording_id_or_index, None))
 
     def __iter__(self) -> Iterable[Recording]:
         return iter(self.recordings.values())
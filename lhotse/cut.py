@@ -1,18 +1,21 @@
-from concurrent.futures import ProcessPoolExecutor
+from collections import OrderedDict, deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from dataclasses import dataclass, field
 
 import logging
 import numpy as np
 import random
+import threading
 import warnings
 from cytoolz import sliding_window
 from cytoolz.itertoolz import groupby
-from functools import reduce
 from intervaltree import Interval, IntervalTree
 from itertools import islice
 from math import ceil, floor
 from tqdm.auto import tqdm
-from typing import Any, Callable, Dict, FrozenSet, Iterable, List, Optional, Sequence, Union
+from types import MappingProxyType
+from typing import (Any, Callable, Dict, FrozenSet, Generator, Iterable, List, Mapping, Optional, Sequence, Tuple,
+                    Union)
 
 from lhotse.audio import AudioMixer, Recording, RecordingSet
 from lhotse.augmentation import AugmentFn
@@ -20,9 +23,9 @@ from lhotse.features import FeatureExtractor, FeatureMixer, FeatureSet, Features
 from lhotse.features.base import compute_global_stats
 from lhotse.features.io import FeaturesWriter
 from lhotse.supervision import SupervisionSegment, SupervisionSet
-from lhotse.utils import (Decibels, EPSILON, JsonMixin, Pathlike, Seconds, TimeSpan, YamlMixin, asdict_nonull,
-                          compute_num_frames, fastcopy,
-                          overlaps, overspans, split_sequence, uuid4)
+from lhotse.utils import (Decibels, EPSILON, JsonMixin, JsonlMixin, Pathlike, Seconds, TimeSpan, YamlMixin,
+                          asdict_nonull, compute_num_frames, fastcopy, fresh_id,
+                          overlaps, overspans, split_sequence)
 
 # One of the design principles for Cuts is a maximally "lazy" implementation, e.g. when mixing Cuts,
 # we'd rather sum the feature matrices only after somebody actually calls "load_features". It helps to avoid
@@ -33,6 +36,65 @@ from lhotse.utils import (Decibels, EPSILON, JsonMixin, Pathlike, Seconds, TimeS
 # The class names are strings here so that the Python interpreter resolves them after parsing the whole file.
 AnyCut = Union['Cut', 'MixedCut', 'PaddingCut']
 
+# A global LRU cache for the features loaded with ``Cut.load_features()``.
+# In data augmentation, the same cut (e.g. noise) is often mixed into many different cuts;
+# the cache allows to read and decompress its features only once.
+# It is disabled by default, as it only helps when the same cuts are loaded repeatedly.
+_FEATURES_CACHE: Dict[Tuple, np.ndarray] = OrderedDict()
+_FEATURES_CACHE_LOCK = threading.Lock()
+_FEATURES_CACHE_MAX_BYTES = 0
+_features_cache_num_bytes = 0
+
+
+def get_features_cache_size() -> int:
+    """Return the maximum total size (in bytes) of the feature matrices cached by ``Cut.load_features()``."""
+    return _FEATURES_CACHE_MAX_BYTES
+
+
+def set_features_cache_size(max_bytes: int) -> None:
+    """
+    Set the maximum total size (in bytes) of the feature matrices kept in memory by ``Cut.load_features()``.
+    The least recently used matrices are evicted when the limit is exceeded;
+    the matrices larger than the limit are never cached.
+    The default is 0, which disables the cache.
+
+    Example:
+        >>> set_features_cache_size(2 * 1024 ** 3)  # Use up to 2 GB of memory to cache features.
+    """
+    global _FEATURES_CACHE_MAX_BYTES
+    assert max_bytes >= 0, f"The features cache size has to be non-negative (got {max_bytes})."
+    with _FEATURES_CACHE_LOCK:
+        _FEATURES_CACHE_MAX_BYTES = max_bytes
+        _evict_cached_features()
+
+
+def clear_features_cache() -> None:
+    """Remove all the feature matrices cached by ``Cut.load_features()``."""
+    global _features_cache_num_bytes
+    with _FEATURES_CACHE_LOCK:
+        _FEATURES_CACHE.clear()
+        _features_cache_num_bytes = 0
+
+
+def _cache_features(key: Tuple, feats: np.ndarray) -> bool:
+    """Store ``feats`` in the cache and return ``True``, or return ``False`` if it could not be stored."""
+    global _features_cache_num_bytes
+    with _FEATURES_CACHE_LOCK:
+        if feats.nbytes > _FEATURES_CACHE_MAX_BYTES or key in _FEATURES_CACHE:
+            return False
+        _FEATURES_CACHE[key] = feats
+        _features_cache_num_bytes += feats.nbytes
+        _evict_cached_features()
+        return True
+
+
+def _evict_cached_features() -> None:
+    # Must be called while holding _FEATURES_CACHE_LOCK.
+    global _features_cache_num_bytes
+    while _features_cache_num_bytes > _FEATURES_CACHE_MAX_BYTES:
+        _, evicted = _FEATURES_CACHE.popitem(last=False)
+        _features_cache_num_bytes -= evicted.nbytes
+
 
 # noinspection PyTypeChecker,PyUnresolvedReferences
 class CutUtilsMixin:
@@ -302,10 +364,31 @@ class Cut(CutUtilsMixin):
         """
         Load the features from the underlying storage and cut them to the relevant
         [begin, duration] region of the current Cut.
+        The most recently loaded feature matrices can be kept in a global LRU cache, which is disabled
+        by default (see ``set_features_cache_size()`` and ``clear_features_cache()``).
+        When the cache is enabled, a copy of the cached matrix is returned.
         """
-        if self.has_features:
+        if not self.has_features:
+            return None
+        if _FEATURES_CACHE_MAX_BYTES == 0:
             return self.features.load(start=self.start, duration=self.duration)
-        return None
+        key = (
+            self.features.storage_type,
+            self.features.storage_path,
+            self.features.storage_key,
+            self.start,
+            self.duration
+        )
+        with _FEATURES_CACHE_LOCK:
+            feats = _FEATURES_CACHE.get(key)
+            if feats is not None:
+                _FEATURES_CACHE.move_to_end(key)
+        if feats is None:
+            feats = self.features.load(start=self.start, duration=self.duration)
+            if not _cache_features(key, feats):
+                return feats
+        # The caller gets a copy, so that modifying it in-place does not affect the cached array.
+        return feats.copy()
 
     def load_audio(self) -> Optional[np.ndarray]:
         """
@@ -390,7 +473,14 @@ class Cut(CutUtilsMixin):
         if _supervisions_index is None:
             criterion = overlaps if keep_excessive_supervisions else overspans
             new_time_span = TimeSpan(start=0, end=new_duration)
-            new_supervisions = (segment.with_offset(-offset) for segment in self.supervisions)
+            # Discard the supervisions that are clearly outside of the new cut before creating their shifted copies,
+            # which is much cheaper for cuts with many supervisions. The margin accounts for the rounding
+            # in ``with_offset()``; the exact criterion is still checked below.
+            begin, end = offset - 1e-6, offset + new_duration + 1e-6
+            new_supervisions = (
+                segment.with_offset(-offset) for segment in self.supervisions
+                if segment.start < end and segment.end > begin
+            )
             supervisions = [
                 segment for segment in new_supervisions if criterion(new_time_span, segment)
             ]
@@ -407,7 +497,7 @@ class Cut(CutUtilsMixin):
             ]
 
         return Cut(
-            id=self.id if preserve_id else str(uuid4()),
+            id=self.id if preserve_id else fresh_id(),
             start=new_start,
             duration=new_duration,
             channel=self.channel,
@@ -431,7 +521,7 @@ class Cut(CutUtilsMixin):
         total_num_samples = round(duration * self.sampling_rate) if self.has_recording else None
         padding_duration = round(duration - self.duration, ndigits=8)
         padded = self.append(PaddingCut(
-            id=str(uuid4()),
+            id=fresh_id(),
             duration=padding_duration,
             num_features=self.num_features if self.features is not None else None,
             num_frames=total_num_frames - self.num_frames if self.features is not None else None,
@@ -536,7 +626,7 @@ class PaddingCut(CutUtilsMixin):
     def load_features(self, *args, **kwargs) -> Optional[np.ndarray]:
         if self.has_features:
             value = np.log(EPSILON) if self.use_log_energy else EPSILON
-            return np.ones((self.num_frames, self.num_features), np.float32) * value
+            return np.full((self.num_frames, self.num_features), fill_value=value, dtype=np.float32)
         return None
 
     # noinspection PyUnusedLocal
@@ -558,7 +648,7 @@ class PaddingCut(CutUtilsMixin):
         new_duration = self.duration - offset if duration is None else duration
         assert new_duration > 0.0
         return PaddingCut(
-            id=self.id if preserve_id else str(uuid4()),
+            id=self.id if preserve_id else fresh_id(),
             duration=new_duration,
             num_frames=round(new_duration / self.frame_shift) if self.num_frames is not None else None,
             num_features=self.num_features,
@@ -578,7 +668,7 @@ class PaddingCut(CutUtilsMixin):
         if duration <= self.duration:
             return self
         return PaddingCut(
-            id=str(uuid4()),
+            id=fresh_id(),
             duration=duration,
             num_features=self.num_features,
             num_frames=round(duration / self.frame_shift),
@@ -789,7 +879,7 @@ class MixedCut(CutUtilsMixin):
                     snr=track.snr
                 )
             )
-        return MixedCut(id=str(uuid4()), tracks=new_tracks)
+        return MixedCut(id=fresh_id(), tracks=new_tracks)
 
     def pad(self, duration: Seconds) -> AnyCut:
         """
@@ -799,27 +889,28 @@ class MixedCut(CutUtilsMixin):
         :param duration: The cut's minimal duration after padding.
         :return: a padded MixedCut if duration is greater than this cut's duration, otherwise ``self``.
         """
-        if duration <= self.duration:
+        own_duration = self.duration
+        if duration <= own_duration:
             return self
         if self.has_features:
             total_num_frames = compute_num_frames(duration=duration, frame_shift=self.frame_shift)
         if self.has_recording:
             total_num_samples = round(duration * self.sampling_rate)
-        padding_duration = round(duration - self.duration, ndigits=8)
+        padding_duration = round(duration - own_duration, ndigits=8)
         return self.append(PaddingCut(
-            id=str(uuid4()),
+            id=fresh_id(),
             duration=padding_duration,
             num_features=self.num_features,
             # The num_frames and sampling_rate fields are tricky, because it is possible to create a MixedCut
             # from Cuts that have different sampling rates and frame shifts. In that case, we are assuming
             # that we should use the values from the reference cut, i.e. the first one in the mix.
             num_frames=(
-                total_num_frames - self.num_frames
+                total_num_frames - compute_num_frames(duration=own_duration, frame_shift=self.frame_shift)
                 if self.has_features
                 else None
             ),
             num_samples=(
-                total_num_samples - self.num_samples
+                total_num_samples - round(own_duration * self.sampling_rate)
                 if self.has_recording
                 else None
             ),
@@ -836,11 +927,12 @@ class MixedCut(CutUtilsMixin):
         :return: A numpy ndarray with features and with shape ``(num_frames, num_features)``,
             or ``(num_tracks, num_frames, num_features)``
         """
-        if not self.has_features:
+        reference_cut = self._first_non_padding_cut
+        if not reference_cut.has_features:
             return None
         first_cut = self.tracks[0].cut
         mixer = FeatureMixer(
-            feature_extractor=create_default_feature_extractor(self._first_non_padding_cut.features.type),
+            feature_extractor=create_default_feature_extractor(reference_cut.features.type),
             base_feats=first_cut.load_features(),
             frame_shift=first_cut.frame_shift,
         )
@@ -852,23 +944,25 @@ class MixedCut(CutUtilsMixin):
             )
         if mixed:
             feats = mixer.mixed_feats
+            # Computing num_frames requires a pass over all tracks to find the duration - do it only once.
+            num_frames = compute_num_frames(duration=self.duration, frame_shift=reference_cut.frame_shift)
             # Note: The slicing below is a work-around for an edge-case
             #  when two cuts have durations that ended with 0.005 (e.g. 10.125 and 5.715)
             #  - then, the feature extractor "squeezed in" a last extra frame and the simple
             #  relationship between num_frames and duration we strived for is not true;
             #  i.e. the duration is 10.125 + 5.715 = 15.84, but the number of frames is
             #  1013 + 572 = 1585. If the frame_shift is 0.01, we have gained an extra 0.01s...
-            if feats.shape[0] - self.num_frames == 1:
-                feats = feats[:self.num_frames, :]
+            if feats.shape[0] - num_frames == 1:
+                feats = feats[:num_frames, :]
             # TODO(pzelasko): This can sometimes happen in a MixedCut with >= 5 different Cuts,
             #   with a regular Cut at the end, when the mix offsets are floats with a lot of decimals.
             #   For now we're duplicating the last frame to match the declared "num_frames" of this cut.
-            if feats.shape[0] - self.num_frames == -1:
+            if feats.shape[0] - num_frames == -1:
                 feats = np.concatenate((feats, feats[-1:, :]), axis=0)
-            assert feats.shape[0] == self.num_frames, "Inconsistent number of frames in a MixedCut: please report " \
-                                                      "this issue at https://github.com/lhotse-speech/lhotse/issues " \
-                                                      "showing the output of print(cut) or str(cut) on which" \
-                                                      "load_features() was called."
+            assert feats.shape[0] == num_frames, "Inconsistent number of frames in a MixedCut: please report " \
+                                                 "this issue at https://github.com/lhotse-speech/lhotse/issues " \
+                                                 "showing the output of print(cut) or str(cut) on which" \
+                                                 "load_features() was called."
             return feats
         else:
             return mixer.unmixed_feats
@@ -894,14 +988,16 @@ class MixedCut(CutUtilsMixin):
             # Off-by-one errors can happen during mixing due to imperfect float arithmetic and rounding;
             # we will fix them on-the-fly so that the manifest does not lie about the num_samples.
             audio = mixer.mixed_audio
-            if audio.shape[1] - self.num_samples == 1:
-                audio = audio[:, :self.num_samples]
-            if audio.shape[1] - self.num_samples == -1:
+            # Computing num_samples requires a pass over all tracks to find the duration - do it only once.
+            num_samples = self.num_samples
+            if audio.shape[1] - num_samples == 1:
+                audio = audio[:, :num_samples]
+            if audio.shape[1] - num_samples == -1:
                 audio = np.concatenate((audio, audio[:, -1:]), axis=1)
-            assert audio.shape[1] == self.num_samples, "Inconsistent number of samples in a MixedCut: please report " \
-                                                       "this issue at https://github.com/lhotse-speech/lhotse/issues " \
-                                                       "showing the output of print(cut) or str(cut) on which" \
-                                                       "load_audio() was called."
+            assert audio.shape[1] == num_samples, "Inconsistent number of samples in a MixedCut: please report " \
+                                                  "this issue at https://github.com/lhotse-speech/lhotse/issues " \
+                                                  "showing the output of print(cut) or str(cut) on which" \
+                                                  "load_audio() was called."
         else:
             audio = mixer.unmixed_audio
         return audio
@@ -1037,11 +1133,11 @@ class MixedCut(CutUtilsMixin):
 
     @property
     def _first_non_padding_cut(self) -> Cut:
-        return [t.cut for t in self.tracks if not isinstance(t.cut, PaddingCut)][0]
+        return next(t.cut for t in self.tracks if not isinstance(t.cut, PaddingCut))
 
 
 @dataclass
-class CutSet(JsonMixin, YamlMixin, Sequence[AnyCut]):
+class CutSet(JsonMixin, JsonlMixin, YamlMixin, Sequence[AnyCut]):
     """
     CutSet combines features with their corresponding supervisions.
     It may have wider span than the actual supervisions, provided the features for the whole span exist.
@@ -1049,13 +1145,35 @@ class CutSet(JsonMixin, YamlMixin, Sequence[AnyCut]):
     """
     cuts: Dict[str, AnyCut]
 
+    # The partitions of ``cuts`` by cut type are computed lazily, in a single pass, on the first access
+    # to ``mixed_cuts`` or ``simple_cuts``. Like the rest of the ``CutSet`` API, they assume that ``cuts``
+    # is not modified in-place after the ``CutSet`` was created.
+    _mixed_cuts: Optional[Dict[str, MixedCut]] = field(default=None, init=False, repr=False, compare=False)
+    _simple_cuts: Optional[Dict[str, Cut]] = field(default=None, init=False, repr=False, compare=False)
+
     @property
-    def mixed_cuts(self) -> Dict[str, MixedCut]:
-        return {id_: cut for id_, cut in self.cuts.items() if isinstance(cut, MixedCut)}
+    def mixed_cuts(self) -> Mapping[str, MixedCut]:
+        """A read-only mapping of the IDs to the ``MixedCut``s in this ``CutSet``."""
+        if self._mixed_cuts is None:
+            self._partition_cuts()
+        # The partition is cached and shared by all the callers, so we don't allow modifying it.
+        return MappingProxyType(self._mixed_cuts)
 
     @property
-    def simple_cuts(self) -> Dict[str, Cut]:
-        return {id_: cut for id_, cut in self.cuts.items() if isinstance(cut, Cut)}
+    def simple_cuts(self) -> Mapping[str, Cut]:
+        """A read-only mapping of the IDs to the (non-mixed) ``Cut``s in this ``CutSet``."""
+        if self._simple_cuts is None:
+            self._partition_cuts()
+        return MappingProxyType(self._simple_cuts)
+
+    def _partition_cuts(self) -> None:
+        mixed_cuts, simple_cuts = {}, {}
+        for id_, cut in self.cuts.items():
+            if isinstance(cut, MixedCut):
+                mixed_cuts[id_] = cut
+            elif isinstance(cut, Cut):
+                simple_cuts[id_] = cut
+        self._mixed_cuts, self._simple_cuts = mixed_cuts, simple_cuts
 
     @property
     def ids(self) -> Iterable[str]:
@@ -1091,7 +1209,7 @@ class CutSet(JsonMixin, YamlMixin, Sequence[AnyCut]):
             # Use features to determine the cut boundaries and attach recordings and supervisions as available.
             return CutSet.from_cuts(
                 Cut(
-                    id=str(uuid4()),
+                    id=fresh_id(),
                     start=feats.start,
                     duration=feats.duration,
                     channel=feats.channels,
@@ -1112,7 +1230,7 @@ class CutSet(JsonMixin, YamlMixin, Sequence[AnyCut]):
         # Use recordings to determine the cut boundaries.
         return CutSet.from_cuts(
             Cut(
-                id=str(uuid4()),
+                id=fresh_id(),
                 start=0,
                 duration=recording.duration,
                 channel=channel,
@@ -1141,7 +1259,10 @@ class CutSet(JsonMixin, YamlMixin, Sequence[AnyCut]):
         return CutSet.from_cuts(deserialize_one(cut) for cut in data)
 
     def to_dicts(self) -> List[dict]:
-        return [{**asdict_nonull(cut), 'type': type(cut).__name__} for cut in self]
+        return list(self._iter_dicts())
+
+    def _iter_dicts(self) -> Iterable[dict]:
+        return ({**asdict_nonull(cut), 'type': type(cut).__name__} for cut in self)
 
     def describe(self) -> None:
         """
@@ -1298,10 +1419,12 @@ class CutSet(JsonMixin, YamlMixin, Sequence[AnyCut]):
         In the AMI example, the ``multi_channel_cut_set`` will yield MixedCuts that hold all single-channel
         Cuts together.
         """
-        if self.mixed_cuts:
+        if any(isinstance(cut, MixedCut) for cut in self):
             raise ValueError("This operation is not applicable to CutSet's containing MixedCut's.")
-        groups = groupby(lambda cut: (cut.recording.id, cut.start, cut.end), self)
-        return CutSet.from_cuts(mix_cuts(cuts) for cuts in groups.values())
+        groups = groupby(lambda cut: (cut.recording_id, cut.start, cut.end), self)
+        # Sort each group by channel, so that the lowest channel is always the reference track of the mix,
+        # regardless of the order in which the cuts are stored in the CutSet.
+        return CutSet.from_cuts(mix_cuts(sorted(cuts, key=lambda cut: cut.channel)) for cuts in groups.values())
 
     def sort_by_duration(self, ascending: bool = False) -> 'CutSet':
         """Sort the CutSet according to cuts duration. Descending by default."""
@@ -1515,6 +1638,44 @@ class CutSet(JsonMixin, YamlMixin, Sequence[AnyCut]):
             storage_path=storage_path
         )
 
+    def prefetch(
+            self,
+            num_workers: int = 4,
+            buffer_size: int = 16
+    ) -> Generator[Tuple[AnyCut, Optional[np.ndarray]], None, None]:
+        """
+        Iterate over the cuts in this ``CutSet`` together with their features, which are loaded
+        in background threads ahead of the consumer. It helps to hide the feature I/O latency
+        (reading and decompressing the data, mixing ``MixedCut`` tracks) behind the consumer's computation.
+        The cuts are yielded in the same order as when iterating over the ``CutSet``.
+
+        Example:
+            >>> for cut, feats in cut_set.prefetch(num_workers=4):
+            ...     pass
+
+        :param num_workers: the number of threads that load the features.
+        :param buffer_size: the maximum number of cuts for which the features are loaded (or being loaded)
+            ahead of the consumer; it limits the memory used by the prefetched features.
+        :return: a generator of ``(cut, features)`` tuples; ``features`` is None for cuts without features.
+        """
+        assert num_workers > 0, f"Invalid number of prefetching workers: {num_workers}"
+        assert buffer_size > 0, f"Invalid prefetching buffer size: {buffer_size}"
+        pending = deque()
+        with ThreadPoolExecutor(num_workers) as executor:
+            try:
+                for cut in self:
+                    pending.append((cut, executor.submit(cut.load_features)))
+                    if len(pending) >= buffer_size:
+                        cut, feats = pending.popleft()
+                        yield cut, feats.result()
+                while pending:
+                    cut, feats = pending.popleft()
+                    yield cut, feats.result()
+            finally:
+                # When the consumer stops early, don't load the features that will not be used.
+                for _, feats in pending:
+                    feats.cancel()
+
     def with_features_path_prefix(self, path: Pathlike) -> 'CutSet':
         return CutSet.from_cuts(c.with_features_path_prefix(path) for c in self)
 
@@ -1552,8 +1713,9 @@ class CutSet(JsonMixin, YamlMixin, Sequence[AnyCut]):
     def __getitem__(self, cut_id_or_index: Union[int, str]) -> 'AnyCut':
         if isinstance(cut_id_or_index, str):
             return self.cuts[cut_id_or_index]
-        # ~100x faster than list(dict.values())[index] for 100k elements
-        return next(val for idx, val in enumerate(self.cuts.values()) if idx == cut_id_or_index)
+        # Much faster than list(dict.values())[index] or an enumerate() scan for 100k elements,
+        # as islice skips the preceding items without materializing or comparing them in Python
+        return next(islice(self.cuts.values(), cut_id_or_index, None))
 
     def __len__(self) -> int:
         return len(self.cuts)
@@ -1562,7 +1724,9 @@ class CutSet(JsonMixin, YamlMixin, Sequence[AnyCut]):
         return iter(self.cuts.values())
 
     def __add__(self, other: 'CutSet') -> 'CutSet':
-        assert not set(self.cuts.keys()).intersection(other.cuts.keys()), "Conflicting IDs when concatenating CutSets!"
+        # Look up the IDs of the smaller CutSet in the larger one, instead of building a set of all the IDs.
+        smaller, larger = sorted((self.cuts, other.cuts), key=len)
+        assert not any(cut_id in larger for cut_id in smaller), "Conflicting IDs when concatenating CutSets!"
         return CutSet(cuts={**self.cuts, **other.cuts})
 
 
@@ -1588,28 +1752,31 @@ def make_windowed_cuts_from_features(
     if cut_shift is None:
         cut_shift = cut_duration
     round_fn = ceil if keep_shorter_windows else floor
-    cuts = []
-    for features in feature_set:
-        # Determine the number of cuts, depending on `keep_shorter_windows` argument.
-        # When its true, we'll want to include the residuals in the output; otherwise,
-        # we provide only full duration cuts.
-        n_cuts = round_fn(features.duration / cut_shift)
-        if (n_cuts - 1) * cut_shift + cut_duration > features.duration and not keep_shorter_windows:
-            n_cuts -= 1
-        for idx in range(n_cuts):
-            offset = features.start + idx * cut_shift
-            duration = min(cut_duration, features.end - offset)
-            cuts.append(
-                Cut(
-                    id=str(uuid4()),
+
+    # The cuts are generated lazily and consumed directly by CutSet.from_cuts(),
+    # so that we don't build an intermediate list of all the cuts first.
+    def generate_cuts() -> Generator[Cut, None, None]:
+        for features in feature_set:
+            # Determine the number of cuts, depending on `keep_shorter_windows` argument.
+            # When its true, we'll want to include the residuals in the output; otherwise,
+            # we provide only full duration cuts.
+            n_cuts = round_fn(features.duration / cut_shift)
+            if (n_cuts - 1) * cut_shift + cut_duration > features.duration and not keep_shorter_windows:
+                n_cuts -= 1
+            # These don't change between the windows of the same Features object.
+            start, end, channel = features.start, features.end, features.channels
+            for idx in range(n_cuts):
+                offset = start + idx * cut_shift
+                yield Cut(
+                    id=fresh_id(),
                     start=offset,
-                    duration=duration,
-                    channel=features.channels,
+                    duration=min(cut_duration, end - offset),
+                    channel=channel,
                     features=features,
                     supervisions=[]
                 )
-            )
-    return CutSet.from_cuts(cuts)
+
+    return CutSet.from_cuts(generate_cuts())
 
 
 def mix(
@@ -1643,40 +1810,47 @@ def mix(
                                              f" which is greater than cuts {reference_cut.id} duration" \
                                              f" of {reference_cut.duration}"
     # When the left_cut is a MixedCut, take its existing tracks, otherwise create a new track.
-    old_tracks = (
-        reference_cut.tracks
-        if isinstance(reference_cut, MixedCut)
-        else [MixTrack(cut=reference_cut)]
-    )
+    old_tracks = _reference_tracks(reference_cut)
     # When the right_cut is a MixedCut, adapt its existing tracks with the new offset and snr,
     # otherwise create a new track.
-    new_tracks = (
-        [
-            MixTrack(
-                cut=track.cut,
-                offset=round(track.offset + offset, ndigits=3),
-                snr=(
-                    # When no new SNR is specified, retain whatever was there in the first place.
-                    track.snr if snr is None
-                    # When new SNR is specified but none was specified before, assign the new SNR value.
-                    else snr if track.snr is None
-                    # When both new and previous SNR were specified, assign their sum,
-                    # as the SNR for each track is defined with regard to the first track energy.
-                    else track.snr + snr if snr is not None and track is not None
-                    # When no SNR was specified whatsoever, use none.
-                    else None
-                )
-            ) for track in mixed_in_cut.tracks
-        ]
-        if isinstance(mixed_in_cut, MixedCut)
-        else [MixTrack(cut=mixed_in_cut, offset=offset, snr=snr)]
-    )
+    new_tracks = _as_tracks(mixed_in_cut, offset=offset, snr=snr)
     return MixedCut(
-        id=str(uuid4()),
+        id=fresh_id(),
         tracks=old_tracks + new_tracks
     )
 
 
+def _reference_tracks(cut: AnyCut) -> List[MixTrack]:
+    """Return the list of ``MixTrack``s that represent the reference ``cut`` in a mix."""
+    return list(cut.tracks) if isinstance(cut, MixedCut) else [MixTrack(cut=cut)]
+
+
+def _as_tracks(cut: AnyCut, offset: Seconds = 0, snr: Optional[Decibels] = None) -> List[MixTrack]:
+    """
+    Return the list of ``MixTrack``s that represent the mixed-in ``cut`` in a mix, when it is shifted by
+    ``offset`` seconds and scaled with ``snr``. A ``MixedCut`` is flattened into its tracks.
+    """
+    if not isinstance(cut, MixedCut):
+        return [MixTrack(cut=cut, offset=offset, snr=snr)]
+    return [
+        MixTrack(
+            cut=track.cut,
+            offset=round(track.offset + offset, ndigits=3),
+            snr=(
+                # When no new SNR is specified, retain whatever was there in the first place.
+                track.snr if snr is None
+                # When new SNR is specified but none was specified before, assign the new SNR value.
+                else snr if track.snr is None
+                # When both new and previous SNR were specified, assign their sum,
+                # as the SNR for each track is defined with regard to the first track energy.
+                else track.snr + snr if snr is not None and track is not None
+                # When no SNR was specified whatsoever, use none.
+                else None
+            )
+        ) for track in cut.tracks
+    ]
+
+
 def append(
         left_cut: AnyCut,
         right_cut: AnyCut,
@@ -1688,16 +1862,43 @@ def append(
 
 def mix_cuts(cuts: Iterable[AnyCut]) -> MixedCut:
     """Return a MixedCut that consists of the input Cuts mixed with each other as-is."""
-    # The following is a fold (accumulate/aggregate) operation; it starts with cuts[0], and mixes it with cuts[1];
-    #  then takes their mix and mixes it with cuts[2]; and so on.
-    return reduce(mix, cuts)
+    return _combine_cuts(cuts, sequential=False)
 
 
 def append_cuts(cuts: Iterable[AnyCut]) -> AnyCut:
     """Return a MixedCut that consists of the input Cuts appended to each other as-is."""
-    # The following is a fold (accumulate/aggregate) operation; it starts with cuts[0], and appends cuts[1] to it;
-    #  then takes their it concatenation and appends cuts[2] to it; and so on.
-    return reduce(append, cuts)
+    return _combine_cuts(cuts, sequential=True)
+
+
+def _combine_cuts(cuts: Iterable[AnyCut], sequential: bool) -> AnyCut:
+    """
+    Mix (or append, when ``sequential`` is true) all the ``cuts`` into a single ``MixedCut``.
+
+    The result is the same as that of a fold (accumulate/aggregate) operation with ``mix`` (or ``append``);
+    i.e. start with cuts[0], and mix it with cuts[1]; then take their mix and mix it with cuts[2]; and so on.
+    However, we only collect the tracks of each cut in a single pass, which avoids creating the intermediate
+    ``MixedCut``s, copying their growing lists of tracks, and re-computing the duration of the mix at each step.
+    """
+    cuts = iter(cuts)
+    try:
+        reference_cut = next(cuts)
+    except StopIteration:
+        raise TypeError("Cannot combine an empty sequence of cuts.")
+    tracks = None
+    duration = reference_cut.duration
+    for cut in cuts:
+        if tracks is None:
+            tracks = _reference_tracks(reference_cut)
+        if reference_cut.num_features is not None:
+            assert reference_cut.num_features == cut.num_features, "Cannot mix cuts with different feature " \
+                                                                   "dimensions. "
+        new_tracks = _as_tracks(cut, offset=duration if sequential else 0)
+        tracks.extend(new_tracks)
+        duration = round(max(duration, *(t.offset + t.cut.duration for t in new_tracks)), ndigits=8)
+    if tracks is None:
+        # There was only a single cut, so there is nothing to mix.
+        return reference_cut
+    return MixedCut(id=fresh_id(), tracks=tracks)
 
 
 def _extract_and_store_features_helper_fn(cut: AnyCut, *args, **kwargs) -> AnyCut:
@@ -15,9 +15,8 @@ from tqdm.auto import tqdm
 from lhotse.audio import Recording
 from lhotse.augmentation import AugmentFn
 from lhotse.features.io import FeaturesWriter, get_reader
-from lhotse.utils import (JsonMixin, Pathlike, Seconds, YamlMixin, fastcopy, load_yaml, save_to_yaml,
-                          split_sequence,
-                          uuid4)
+from lhotse.utils import (JsonMixin, JsonlMixin, Pathlike, Seconds, YamlMixin, fastcopy, fresh_id, load_yaml,
+                          save_to_yaml, split_sequence)
 
 
 class FeatureExtractor(metaclass=ABCMeta):
@@ -376,7 +375,7 @@ class Features:
 
 
 @dataclass
-class FeatureSet(JsonMixin, YamlMixin, Sequence[Features]):
+class FeatureSet(JsonMixin, JsonlMixin, YamlMixin, Sequence[Features]):
     """
     Represents a feature manifest, and allows to read features for given recordings
     within particular channels and time ranges.
@@ -397,7 +396,10 @@ class FeatureSet(JsonMixin, YamlMixin, Sequence[Features]):
         return FeatureSet(features=[Features.from_dict(feature_data) for feature_data in data])
 
     def to_dicts(self) -> List[dict]:
-        return [asdict(f) for f in self]
+        return list(self._iter_dicts())
+
+    def _iter_dicts(self) -> Iterable[dict]:
+        return (asdict(f) for f in self)
 
     def with_path_prefix(self, path: Pathlike) -> 'FeatureSet':
         return FeatureSet.from_features(f.with_path_prefix(path) for f in self)
@@ -604,7 +606,7 @@ def store_feature_array(
     :param storage: a ``FeaturesWriter`` object to use for array storage.
     :return: a path to the file containing the stored array.
     """
-    feats_id = str(uuid4())
+    feats_id = fresh_id()
     storage_key = storage.write(feats_id, feats)
     return storage_key
 
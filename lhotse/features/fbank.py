@@ -4,7 +4,7 @@ import numpy as np
 import torchaudio
 
 from lhotse.features.base import TorchaudioFeatureExtractor, register_extractor
-from lhotse.utils import Seconds, EPSILON
+from lhotse.utils import LOG_EPSILON, Seconds
 
 
 @dataclass
@@ -44,13 +44,12 @@ class Fbank(TorchaudioFeatureExtractor):
 
     @staticmethod
     def mix(features_a: np.ndarray, features_b: np.ndarray, energy_scaling_factor_b: float) -> np.ndarray:
-        return np.log(
-            np.maximum(
-                # protection against log(0); max with EPSILON is adequate since these are energies (always >= 0)
-                EPSILON,
-                np.exp(features_a) + energy_scaling_factor_b * np.exp(features_b)
-            )
-        )
+        # log(exp(a) + gain * exp(b)) == logaddexp(a, b + log(gain)), evaluated as a single vectorized ufunc
+        #  without materializing the intermediate energies.
+        log_gain = np.log(energy_scaling_factor_b, dtype=features_b.dtype)
+        mixed = np.logaddexp(features_a, features_b + log_gain)
+        # protection against log(0); clamping with LOG_EPSILON is equivalent to clamping the energies with EPSILON
+        return np.maximum(LOG_EPSILON, mixed, out=mixed)
 
     @staticmethod
     def compute_energy(features: np.ndarray) -> float:
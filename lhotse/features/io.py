@@ -154,6 +154,33 @@ def get_writer(name: str) -> Type[FeaturesWriter]:
     return WRITER_BACKENDS.get(name)
 
 
+"""
+Helpers for storing non-compressed numpy arrays with a reduced precision.
+"""
+
+# Storage dtypes supported by the non-compressed numpy backends, mapped to the dtype the arrays are
+# converted back to when they are read. Half-precision floats cover the dynamic range of log-energy features
+# (e.g. fbank) with a resolution comparable to the default lilcom compression, while halving the size
+# of the stored features and the amount of I/O needed to load them.
+STORAGE_DTYPES = {
+    'float16': np.float32,
+}
+
+
+def _check_storage_dtype(dtype: Optional[str]) -> Optional[str]:
+    if dtype is not None and dtype not in STORAGE_DTYPES:
+        raise ValueError(f"Unsupported storage dtype: '{dtype}' (supported: {', '.join(STORAGE_DTYPES)}).")
+    return dtype
+
+
+def _to_storage_dtype(value: np.ndarray, dtype: Optional[str]) -> np.ndarray:
+    return value if dtype is None else value.astype(dtype)
+
+
+def _read_dtype(dtype: np.dtype) -> np.dtype:
+    return STORAGE_DTYPES.get(dtype.name, dtype)
+
+
 """
 Lilcom-compressed numpy arrays, stored in separate files on the filesystem.
 """
@@ -221,6 +248,19 @@ Non-compressed numpy arrays, stored in separate files on the filesystem.
 """
 
 
+@lru_cache(maxsize=64)
+def lookup_cache_or_mmap(path: str) -> np.memmap:
+    """
+    Helper internal function used in numpy files readers.
+    It memory-maps the ``.npy`` files and keeps a limited number of the most recently used maps open
+    in a global program cache, so that reading many short cuts from the same features file
+    does not re-open the file and parse its header each time, nor read the whole array from disk.
+
+    The memory maps can be freed at any time by calling ``close_cached_file_handles()``.
+    """
+    return np.load(path, mmap_mode='r', allow_pickle=False)
+
+
 @register_reader
 class NumpyFilesReader(FeaturesReader):
     """
@@ -240,8 +280,10 @@ class NumpyFilesReader(FeaturesReader):
             left_offset_frames: int = 0,
             right_offset_frames: Optional[int] = None
     ) -> np.ndarray:
-        arr = np.load(self.storage_path / key, allow_pickle=False)
-        return arr[left_offset_frames: right_offset_frames]
+        arr = lookup_cache_or_mmap(str(self.storage_path / key))
+        # Only the requested frames are read from the memory-mapped file and copied into memory;
+        # the copy ensures the caller gets a regular, writable array that does not keep the file open.
+        return np.array(arr[left_offset_frames: right_offset_frames], dtype=_read_dtype(arr.dtype))
 
 
 @register_writer
@@ -253,10 +295,16 @@ class NumpyFilesWriter(FeaturesWriter):
     """
     name = 'numpy_files'
 
-    def __init__(self, storage_path: Pathlike, *args, **kwargs):
+    def __init__(self, storage_path: Pathlike, dtype: Optional[str] = None, *args, **kwargs):
+        """
+        :param storage_path: the directory where the files are stored.
+        :param dtype: optional numpy dtype name (e.g. ``'float16'``) used to store the arrays;
+            by default the arrays are stored as they are. See ``STORAGE_DTYPES`` for the supported values.
+        """
         super().__init__()
         self.storage_path_ = Path(storage_path)
         self.storage_path_.mkdir(parents=True, exist_ok=True)
+        self.dtype = _check_storage_dtype(dtype)
 
     @property
     def storage_path(self) -> str:
@@ -269,7 +317,7 @@ class NumpyFilesWriter(FeaturesWriter):
         subdir = self.storage_path_ / key[:3]
         subdir.mkdir(exist_ok=True)
         output_features_path = (subdir / key).with_suffix('.npy')
-        np.save(output_features_path, value, allow_pickle=False)
+        np.save(output_features_path, _to_storage_dtype(value, self.dtype), allow_pickle=False)
         # Include sub-directory in the key, e.g. "abc/abcdef.npy"
         return '/'.join(output_features_path.parts[-2:])
 
@@ -294,8 +342,12 @@ def lookup_cache_or_open(storage_path: str):
 
 
 def close_cached_file_handles() -> None:
-    """Closes the cached file handles in ``lookup_cache_or_open`` (see its docs for more details)."""
+    """
+    Closes the cached file handles in ``lookup_cache_or_open`` and the memory maps in ``lookup_cache_or_mmap``
+    (see their docs for more details).
+    """
     lookup_cache_or_open.cache_clear()
+    lookup_cache_or_mmap.cache_clear()
 
 
 @register_reader
@@ -320,7 +372,8 @@ class NumpyHdf5Reader(FeaturesReader):
     ) -> np.ndarray:
         # (pzelasko): If I understand HDF5/h5py correctly, this implementation reads only
         # the requested slice of the array into memory - but don't take my word for it.
-        return self.hdf[key][left_offset_frames: right_offset_frames]
+        arr = self.hdf[key][left_offset_frames: right_offset_frames]
+        return arr.astype(_read_dtype(arr.dtype), copy=False)
 
 
 @register_writer
@@ -333,18 +386,24 @@ class NumpyHdf5Writer(FeaturesWriter):
     """
     name = 'numpy_hdf5'
 
-    def __init__(self, storage_path: Pathlike, *args, **kwargs):
+    def __init__(self, storage_path: Pathlike, dtype: Optional[str] = None, *args, **kwargs):
+        """
+        :param storage_path: the HDF5 file path.
+        :param dtype: optional numpy dtype name (e.g. ``'float16'``) used to store the arrays;
+            by default the arrays are stored as they are. See ``STORAGE_DTYPES`` for the supported values.
+        """
         super().__init__()
         import h5py
         self.storage_path_ = storage_path
         self.hdf = h5py.File(storage_path, 'w')
+        self.dtype = _check_storage_dtype(dtype)
 
     @property
     def storage_path(self) -> str:
         return self.storage_path_
 
     def write(self, key: str, value: np.ndarray) -> str:
-        self.hdf.create_dataset(key, data=value)
+        self.hdf.create_dataset(key, data=_to_storage_dtype(value, self.dtype))
         return key
 
     def close(self) -> None:
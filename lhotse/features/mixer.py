@@ -40,7 +40,11 @@ class FeatureMixer:
             e.g. energies, use either 0 or a small positive value like 1e-5.
         """
         self.feature_extractor = feature_extractor
+        # The tracks are kept unpadded, together with their offsets (in frames) relative to the reference signal.
+        # Padding is only materialized when the (un)mixed features are requested, and the mix of each track
+        # is evaluated only over the frames that the track actually spans.
         self.tracks = [base_feats]
+        self.offsets = [0]
         self.gains = []
         # Keep a pre-computed energy value of the features that we initialize the Mixer with;
         # it is required to compute gain ratios that satisfy SNR during the mix.
@@ -55,13 +59,24 @@ class FeatureMixer:
     def num_features(self):
         return self.tracks[0].shape[1]
 
+    @property
+    def num_frames(self) -> int:
+        return max(offset + track.shape[0] for offset, track in zip(self.offsets, self.tracks))
+
     @property
     def unmixed_feats(self) -> np.ndarray:
         """
         Return a numpy ndarray with the shape (num_tracks, num_frames, num_features), where each track's
         feature matrix is padded and scaled adequately to the offsets and SNR used in ``add_to_mix`` call.
         """
-        return np.stack(self.tracks)
+        result = np.full(
+            (len(self.tracks), self.num_frames, self.num_features),
+            fill_value=self.padding_value,
+            dtype=self.dtype
+        )
+        for idx, (offset, track) in enumerate(zip(self.offsets, self.tracks)):
+            result[idx, offset: offset + track.shape[0]] = track
+        return result
 
     @property
     def mixed_feats(self) -> np.ndarray:
@@ -69,13 +84,36 @@ class FeatureMixer:
         Return a numpy ndarray with the shape (num_frames, num_features) - a mono mixed feature matrix
         of the tracks supplied with ``add_to_mix`` calls.
         """
-        result = self.tracks[0]
-        for feats_to_add, gain in zip(self.tracks[1:], self.gains):
-            result = self.feature_extractor.mix(
-                features_a=result,
+        reference_feats = self.tracks[0]
+        result = np.full(
+            (self.num_frames, self.num_features),
+            fill_value=self.padding_value,
+            dtype=self.dtype
+        )
+        result[:reference_feats.shape[0]] = reference_feats
+        # Tracks which frames are not spanned by any track (e.g. a gap between two appended cuts).
+        uncovered = np.ones(result.shape[0], dtype=bool)
+        uncovered[:reference_feats.shape[0]] = False
+        for feats_to_add, offset, gain in zip(self.tracks[1:], self.offsets[1:], self.gains):
+            # Mixing with padding frames is a no-op, so we only mix the frames that the added track spans.
+            end = offset + feats_to_add.shape[0]
+            result[offset: end] = self.feature_extractor.mix(
+                features_a=result[offset: end],
                 features_b=feats_to_add,
                 energy_scaling_factor_b=gain
             )
+            uncovered[offset: end] = False
+        if uncovered.any():
+            # The frames that contain only padding are still mixed (padding with padding), so that
+            # they are brought to the same floor value that the feature extractor's mix applies.
+            gap_feats = result[uncovered]
+            for gain in self.gains:
+                gap_feats = self.feature_extractor.mix(
+                    features_a=gap_feats,
+                    features_b=np.full_like(gap_feats, fill_value=self.padding_value),
+                    energy_scaling_factor_b=gain
+                )
+            result[uncovered] = gap_feats
         return result
 
     def add_to_mix(
@@ -94,49 +132,7 @@ class FeatureMixer:
         """
         assert offset >= 0.0, "Negative offset in mixing is not supported."
 
-        reference_feats = self.tracks[0]
         num_frames_offset = compute_num_frames(duration=offset, frame_shift=self.frame_shift)
-        current_num_frames = reference_feats.shape[0]
-        incoming_num_frames = feats.shape[0] + num_frames_offset
-        mix_num_frames = max(current_num_frames, incoming_num_frames)
-
-        feats_to_add = feats
-
-        # When the existing frames are less than what we anticipate after the mix,
-        # we need to pad after the end of the existing features mixed so far.
-        if current_num_frames < mix_num_frames:
-            for idx in range(len(self.tracks)):
-                padded_track = np.vstack([
-                    self.tracks[idx],
-                    self.padding_value * np.ones(
-                        (mix_num_frames - current_num_frames, self.num_features),
-                        dtype=self.dtype
-                    )
-                ])
-                self.tracks[idx] = padded_track
-
-        # When there is an offset, we need to pad before the start of the features we're adding.
-        if offset > 0:
-            feats_to_add = np.vstack([
-                self.padding_value * np.ones(
-                    (num_frames_offset, self.num_features),
-                    dtype=self.dtype
-                ),
-                feats_to_add
-            ])
-
-        # When the features we're mixing in are shorter that the anticipated mix length,
-        # we need to pad after their end.
-        # Note: we're doing that inefficiently, as we potentially re-allocate numpy arrays twice,
-        # during this padding and the offset padding before. If that's a bottleneck, we'll optimize.
-        if incoming_num_frames < mix_num_frames:
-            feats_to_add = np.vstack([
-                feats_to_add,
-                self.padding_value * np.ones(
-                    (mix_num_frames - incoming_num_frames, self.num_features),
-                    dtype=self.dtype
-                )
-            ])
 
         # When SNR is requested, find what gain is needed to satisfy the SNR
         gain = 1.0
@@ -148,5 +144,6 @@ class FeatureMixer:
             target_energy = self.reference_energy * (10.0 ** (-snr / 10))
             gain = target_energy / added_feats_energy
 
-        self.tracks.append(feats_to_add)
+        self.tracks.append(feats.astype(self.dtype, copy=False))
+        self.offsets.append(num_frames_offset)
         self.gains.append(gain)
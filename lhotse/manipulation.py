@@ -8,7 +8,7 @@ from lhotse.audio import Recording, RecordingSet
 from lhotse.cut import Cut, CutSet, MixedCut
 from lhotse.features import FeatureSet, Features
 from lhotse.supervision import SupervisionSegment, SupervisionSet
-from lhotse.utils import Pathlike, load_json, load_yaml
+from lhotse.utils import Pathlike, load_json, load_jsonl, load_yaml
 
 ManifestItem = TypeVar('ManifestItem', Recording, SupervisionSegment, Features, Cut, MixedCut)
 Manifest = TypeVar('Manifest', RecordingSet, SupervisionSet, FeatureSet, CutSet)
@@ -26,6 +26,18 @@ def combine(*manifests: Union[Manifest, Sequence[Manifest]]) -> Manifest:
     """
     if len(manifests) == 1 and isinstance(manifests, (tuple, list)):
         manifests = manifests[0]
+    manifests = list(manifests)
+    # Create the dict-based manifests in a single pass over all the items; adding them pairwise
+    # would copy the growing intermediate result for each of the inputs.
+    items = chain.from_iterable(manifests)
+    if isinstance(manifests[0], RecordingSet):
+        return RecordingSet.from_recordings(items)
+    if isinstance(manifests[0], SupervisionSet):
+        return SupervisionSet.from_segments(items)
+    if isinstance(manifests[0], CutSet):
+        combined = CutSet.from_cuts(items)
+        assert len(combined) == sum(len(m) for m in manifests), "Conflicting IDs when concatenating CutSets!"
+        return combined
     return reduce(add, manifests)
 
 
@@ -57,7 +69,11 @@ def to_manifest(items: Iterable[ManifestItem]) -> Optional[Manifest]:
 def load_manifest(path: Pathlike) -> Manifest:
     """Generic utility for reading an arbitrary manifest."""
     try:
-        raw_data = load_json(path)
+        if str(path).endswith(('.jsonl', '.jsonl.gz')):
+            # The items are materialized, as we might need to try deserializing them several times.
+            raw_data = list(load_jsonl(path))
+        else:
+            raw_data = load_json(path)
     except JSONDecodeError:
         try:
             raw_data = load_yaml(path)
@@ -1,7 +1,9 @@
+from bisect import bisect_left, bisect_right
 from dataclasses import dataclass
-from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence
+from itertools import islice
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
 
-from lhotse.utils import JsonMixin, Seconds, YamlMixin, asdict_nonull, fastcopy, split_sequence
+from lhotse.utils import JsonMixin, JsonlMixin, Seconds, YamlMixin, asdict_nonull, fastcopy, split_sequence
 
 
 @dataclass(frozen=True, unsafe_hash=True)
@@ -64,7 +66,7 @@ class SupervisionSegment:
 
 
 @dataclass
-class SupervisionSet(JsonMixin, YamlMixin, Sequence[SupervisionSegment]):
+class SupervisionSet(JsonMixin, JsonlMixin, YamlMixin, Sequence[SupervisionSegment]):
     """
     SupervisionSet represents a collection of segments containing some supervision information.
     The only required fields are the ID of the segment, ID of the corresponding recording,
@@ -84,7 +86,10 @@ class SupervisionSet(JsonMixin, YamlMixin, Sequence[SupervisionSegment]):
         return SupervisionSet.from_segments(SupervisionSegment.from_dict(s) for s in data)
 
     def to_dicts(self) -> List[dict]:
-        return [asdict_nonull(s) for s in self]
+        return list(self._iter_dicts())
+
+    def _iter_dicts(self) -> Iterable[dict]:
+        return (asdict_nonull(s) for s in self)
 
     def split(self, num_splits: int, randomize: bool = False) -> List['SupervisionSet']:
         """
@@ -149,26 +154,33 @@ class SupervisionSet(JsonMixin, YamlMixin, Sequence[SupervisionSegment]):
             In the anticipated use-case, ``start_after`` and ``end_before`` would be
             the beginning and end of a cut;
             this option converts the times to be relative to the start of the cut.
-        :return: An iterator over supervision segments satisfying all criteria.
+        :return: An iterator over supervision segments satisfying all criteria, ordered by their start times.
         """
-        segment_by_recording_id = self._index_by_recording_id_and_cache()
+        starts, segments = self._index_by_recording_id_and_cache()[recording_id]
+        # The segments are sorted by their start times, so we only have to look at the ones
+        # that start within [start_after, end_before] instead of scanning the whole recording.
+        first = bisect_left(starts, start_after)
+        last = len(starts) if end_before is None else bisect_right(starts, end_before)
         return (
             # We only modify the offset - the duration remains the same, as we're only shifting the segment
             # relative to the Cut's start, and not truncating anything.
             segment.with_offset(-start_after) if adjust_offset else segment
-            for segment in segment_by_recording_id[recording_id]
+            for segment in islice(segments, first, last)
             if (channel is None or segment.channel == channel)
-               and segment.start >= start_after
                and (end_before is None or segment.end <= end_before)
         )
 
     # This is a cache that significantly speeds up repeated ``find()`` queries.
-    _segments_by_recording_id: Optional[Dict[str, List[SupervisionSegment]]] = None
+    # It maps a recording ID to a pair of lists: the segments' start times and the segments, sorted by start.
+    _segments_by_recording_id: Optional[Dict[str, Tuple[List[Seconds], List[SupervisionSegment]]]] = None
 
     def _index_by_recording_id_and_cache(self):
         if self._segments_by_recording_id is None:
             from cytoolz import groupby
-            self._segments_by_recording_id = groupby(lambda seg: seg.recording_id, self)
+            self._segments_by_recording_id = {}
+            for recording_id, segments in groupby(lambda seg: seg.recording_id, self).items():
+                segments = sorted(segments, key=lambda seg: seg.start)
+                self._segments_by_recording_id[recording_id] = ([seg.start for seg in segments], segments)
         return self._segments_by_recording_id
 
     def __repr__(self) -> str:
@@ -4,7 +4,7 @@ import numpy as np
 import soundfile
 
 from lhotse import AudioSource, Cut, Fbank, LilcomFilesWriter, Recording
-from lhotse.utils import uuid4
+from lhotse.utils import fresh_id
 
 
 class RandomCutTestCase:
@@ -30,7 +30,7 @@ class RandomCutTestCase:
         samples = np.random.rand(num_samples)
         soundfile.write(f.name, samples, samplerate=sampling_rate)
         return Recording(
-            id=str(uuid4()),
+            id=fresh_id(),
             sources=[
                 AudioSource(
                     type='file',
@@ -46,7 +46,7 @@ class RandomCutTestCase:
     def with_cut(self, sampling_rate: int, num_samples: int, features: bool = True) -> Cut:
         duration = num_samples / sampling_rate
         cut = Cut(
-            id=str(uuid4()),
+            id=fresh_id(),
             start=0,
             duration=duration,
             channel=0,
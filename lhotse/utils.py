@@ -1,20 +1,29 @@
 import gzip
 import json
 import math
+import os
 import random
 import uuid
 from contextlib import AbstractContextManager, contextmanager
-from dataclasses import asdict, dataclass
+from copy import deepcopy
+from dataclasses import dataclass, fields
 from decimal import Decimal, ROUND_HALF_UP
+from functools import lru_cache
 from math import ceil, isclose
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional, Sequence, TypeVar, Union
+from typing import Any, Callable, Dict, Generator, Iterable, List, Optional, Sequence, Tuple, TypeVar, Union
 
 import numpy as np
 import torch
 import yaml
 from tqdm.auto import tqdm
 
+try:
+    # orjson is an optional dependency that makes reading and writing JSON Lines manifests several times faster.
+    import orjson
+except ImportError:
+    orjson = None
+
 Pathlike = Union[Path, str]
 
 Seconds = float
@@ -34,7 +43,7 @@ _lhotse_uuid: Optional[Callable] = None
 def fix_random_seed(random_seed: int):
     """
     Set the same random seed for the libraries and modules that Lhotse interacts with.
-    Includes the ``random`` module, numpy, torch, and ``uuid4()`` function defined in this file.
+    Includes the ``random`` module, numpy, torch, and ``uuid4()`` and ``fresh_id()`` functions defined in this file.
     """
     global _lhotse_uuid
     random.seed(random_seed)
@@ -56,6 +65,18 @@ def uuid4():
     return uuid.uuid4()
 
 
+def fresh_id() -> str:
+    """
+    Generates a random ID string with 32 hexadecimal characters (128 random bits).
+    It is a cheaper alternative to ``str(uuid4())``, as it does not construct the ``uuid.UUID``
+    object and format it with dashes, which adds up when creating millions of cuts.
+    When ``fix_random_seed()`` is called, it will instead generate deterministic IDs.
+    """
+    if _lhotse_uuid is not None:
+        return _lhotse_uuid().hex
+    return os.urandom(16).hex()
+
+
 def save_to_yaml(data: Any, path: Pathlike):
     compressed = str(path).endswith('.gz')
     opener = gzip.open if compressed else open
@@ -114,23 +135,124 @@ class JsonMixin:
         return cls.from_dicts(data)
 
 
+def save_to_jsonl(data: Iterable[Dict[str, Any]], path: Pathlike):
+    """
+    Save the data to a JSON Lines file, with one JSON document (e.g. a single cut) per line.
+    Will use GZip to compress it if the path ends with a ``.gz`` extension.
+    Uses ``orjson`` for serialization when it is installed.
+    """
+    opener = gzip.open if str(path).endswith('.gz') else open
+    with opener(path, 'wb') as f:
+        for item in data:
+            f.write(_dump_json_line(item))
+
+
+def load_jsonl(path: Pathlike) -> Generator[Dict[str, Any], None, None]:
+    """
+    Lazily load a JSON Lines file, yielding one decoded JSON document per line.
+    Unlike ``load_json`` and ``load_yaml``, it does not need to parse the whole file before
+    the first item can be consumed, which avoids holding all the raw dicts in memory at once.
+    Also supports compressed JSON Lines with a ``.gz`` extension.
+    Uses ``orjson`` for deserialization when it is installed.
+    """
+    loads = json.loads if orjson is None else _orjson_loads
+    opener = gzip.open if str(path).endswith('.gz') else open
+    with opener(path, 'rb') as f:
+        for line in f:
+            if line.strip():
+                yield loads(line)
+
+
+def _orjson_loads(line: bytes) -> Any:
+    try:
+        return orjson.loads(line)
+    except orjson.JSONDecodeError:
+        # orjson does not accept the NaN/Infinity literals that the standard json module reads and writes.
+        return json.loads(line)
+
+
+def _dump_json_line(item: Dict[str, Any]) -> bytes:
+    if orjson is not None:
+        # Like the standard json module, convert non-string keys (e.g. ints) to strings instead of raising.
+        line = orjson.dumps(
+            item,
+            default=_json_default,
+            option=orjson.OPT_NON_STR_KEYS | orjson.OPT_APPEND_NEWLINE
+        )
+        # orjson silently writes NaN and infinity as null; in that (rare) case we use the standard
+        # json module, so that the file contents do not depend on whether orjson is installed.
+        if b'null' not in line or not _has_non_finite_float(item):
+            return line
+    return json.dumps(item, default=_json_default).encode() + b'\n'
+
+
+def _json_default(obj: Any) -> Any:
+    # Numpy scalars (e.g. durations computed with numpy) are not serializable by default.
+    if isinstance(obj, np.generic):
+        return obj.item()
+    raise TypeError(f'Object of type {type(obj).__name__} is not JSON serializable')
+
+
+def _has_non_finite_float(obj: Any) -> bool:
+    if isinstance(obj, (float, np.floating)):
+        return not math.isfinite(obj)
+    if isinstance(obj, dict):
+        return any(_has_non_finite_float(v) for v in obj.values())
+    if isinstance(obj, (list, tuple)):
+        return any(_has_non_finite_float(v) for v in obj)
+    return False
+
+
+class JsonlMixin:
+    def to_jsonl(self, path: Pathlike):
+        # The items are converted to dicts one at a time, as they are written,
+        # so that we never hold the whole serialized manifest in memory.
+        save_to_jsonl(self._iter_dicts(), path)
+
+    @classmethod
+    def from_jsonl(cls, path: Pathlike):
+        data = load_jsonl(path)
+        return cls.from_dicts(data)
+
+
 def asdict_nonull(dclass) -> Dict[str, Any]:
     """
     Recursively convert a dataclass into a dict, removing all the fields with `None` value.
     Intended to use in place of dataclasses.asdict(), when the null values are not desired in the serialized document.
     """
 
-    def non_null_dict_factory(collection):
-        d = dict(collection)
-        remove_keys = []
-        for key, val in d.items():
-            if val is None:
-                remove_keys.append(key)
-        for k in remove_keys:
-            del d[k]
-        return d
+    return _asdict_nonull_inner(dclass)
+
+
+_PRIMITIVE_TYPES = (str, int, float, bool)
+
 
-    return asdict(dclass, dict_factory=non_null_dict_factory)
+def _asdict_nonull_inner(obj: Any) -> Any:
+    # This mirrors the conversion done by dataclasses.asdict(), but it avoids building an intermediate
+    # list of (name, value) pairs for each dataclass and returns the most common values (numbers
+    # and strings) directly, without passing them through copy.deepcopy().
+    if isinstance(obj, _PRIMITIVE_TYPES):
+        return obj
+    if hasattr(type(obj), '__dataclass_fields__'):
+        result = {}
+        for name in _dataclass_field_names(type(obj)):
+            value = getattr(obj, name)
+            if value is not None:
+                result[name] = _asdict_nonull_inner(value)
+        return result
+    if isinstance(obj, tuple) and hasattr(obj, '_fields'):
+        # A namedtuple has to be constructed with positional arguments.
+        return type(obj)(*[_asdict_nonull_inner(v) for v in obj])
+    if isinstance(obj, (list, tuple)):
+        return type(obj)(_asdict_nonull_inner(v) for v in obj)
+    if isinstance(obj, dict):
+        return type(obj)((_asdict_nonull_inner(k), _asdict_nonull_inner(v)) for k, v in obj.items())
+    return deepcopy(obj)
+
+
+@lru_cache(maxsize=None)
+def _dataclass_field_names(cls: type) -> Tuple[str, ...]:
+    return tuple(f.name for f in fields(cls))
 
 
 class SetContainingAnything:
@@ -144,6 +266,9 @@ class SetContainingAnything:
 @dataclass
 class TimeSpan:
     """Helper class for specifying a time span."""
+    # It is created very often (e.g. for every truncated cut), so we avoid the per-instance ``__dict__``.
+    # Note: ``__slots__`` can only be declared manually in dataclasses that have no default field values.
+    __slots__ = ('start', 'end')
     start: Seconds
     end: Seconds
 
@@ -213,7 +338,12 @@ def fastcopy(dataclass_obj: T, **kwargs) -> T:
         >>> ts1 = TimeSpan(start=5, end=10)
         >>> ts2 = fastcopy(ts1, end=12)
     """
-    return type(dataclass_obj)(**{**dataclass_obj.__dict__, **kwargs})
+    try:
+        members = dataclass_obj.__dict__
+    except AttributeError:
+        # Dataclasses that define ``__slots__`` don't have a ``__dict__``.
+        members = {name: getattr(dataclass_obj, name) for name in dataclass_obj.__slots__}
+    return type(dataclass_obj)(**{**members, **kwargs})
 
 
 def split_sequence(seq: Sequence[Any], num_splits: int, randomize: bool = False) -> List[List[Any]]:
@@ -1,7 +1,10 @@
+from unittest.mock import patch
+
+import numpy as np
 import pytest
 
 from lhotse.audio import RecordingSet, Recording, AudioSource
-from lhotse.cut import CutSet
+from lhotse.cut import CutSet, clear_features_cache, get_features_cache_size, set_features_cache_size
 from lhotse.features import FeatureSet, Features
 from lhotse.supervision import SupervisionSet, SupervisionSegment
 from lhotse.testing.dummies import dummy_cut, dummy_supervision
@@ -72,6 +75,56 @@ def test_load_features(libri_cut):
     assert feats.shape[1] == libri_cut.features.num_features
 
 
+@pytest.fixture
+def features_cache_size():
+    previous_size = get_features_cache_size()
+    clear_features_cache()
+    yield set_features_cache_size
+    set_features_cache_size(previous_size)
+    clear_features_cache()
+
+
+def test_load_features_uses_cache(libri_cut, features_cache_size):
+    features_cache_size(100 * 1024 ** 2)
+    feats = libri_cut.load_features()
+    feats[:] = 0  # Modifying the returned array must not affect the cached one.
+    with patch.object(Features, 'load', side_effect=AssertionError('Features should be read from cache.')):
+        cached_feats = libri_cut.load_features()
+    assert cached_feats is not feats
+    assert (cached_feats != 0).any()
+    np.testing.assert_equal(cached_feats, libri_cut.features.load(start=libri_cut.start, duration=libri_cut.duration))
+
+
+def test_load_features_cache_is_bounded_by_size_in_bytes(libri_cut, features_cache_size):
+    first, second = libri_cut.truncate(duration=5.0), libri_cut.truncate(offset=5.0, duration=5.0)
+    num_bytes = first.load_features().nbytes
+    # The cache fits only one of the two feature matrices.
+    features_cache_size(num_bytes + 1)
+    first.load_features()
+    second.load_features()
+    with patch.object(Features, 'load', side_effect=AssertionError('Features should be read from cache.')):
+        second.load_features()
+    with patch.object(Features, 'load', return_value=np.zeros(1)) as load:
+        first.load_features()
+    load.assert_called_once()
+
+
+def test_load_features_larger_than_cache_are_not_cached(libri_cut, features_cache_size):
+    features_cache_size(1)
+    libri_cut.load_features()
+    with patch.object(Features, 'load', return_value=np.zeros(1)) as load:
+        libri_cut.load_features()
+    load.assert_called_once()
+
+
+def test_load_features_with_cache_disabled(libri_cut, features_cache_size):
+    features_cache_size(0)
+    libri_cut.load_features()
+    with patch.object(Features, 'load', return_value='not-cached') as load:
+        assert libri_cut.load_features() == 'not-cached'
+    load.assert_called_once()
+
+
 def test_load_none_features(libri_cut):
     libri_cut.features = None
     feats = libri_cut.load_features()
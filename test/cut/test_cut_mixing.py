@@ -1,11 +1,13 @@
+from functools import reduce
 from lhotse.utils import nullcontext as does_not_raise
 from math import isclose
 
 import pytest
 
-from lhotse.cut import CutSet, MixedCut
+from lhotse.cut import CutSet, MixedCut, append, append_cuts, mix, mix_cuts
 from lhotse.supervision import SupervisionSegment
-from lhotse.testing.dummies import remove_spaces_from_segment_text
+from lhotse.testing.dummies import dummy_cut, remove_spaces_from_segment_text
+from lhotse.utils import LOG_EPSILON, compute_num_frames
 
 
 # Note:
@@ -89,3 +91,37 @@ def test_mixed_cut_load_audio_mixed(mixed_audio_cut):
 def test_mixed_cut_load_audio_unmixed(mixed_audio_cut):
     audio = mixed_audio_cut.load_audio(mixed=False)
     assert audio.shape == (2, 230400)
+
+
+@pytest.mark.parametrize('reference_duration', [1.005, 1.045, 1.065])
+def test_append_leaves_no_unmixed_padding_in_gap_frames(reference_duration):
+    cut = CutSet.from_json('test/fixtures/libri/cuts.json')[0]
+    reference_cut = cut.truncate(duration=reference_duration)
+    # The reference features are one frame shorter than its duration implies,
+    # so the appended cut leaves a single frame gap in the mix.
+    assert reference_cut.load_features().shape[0] == compute_num_frames(reference_duration, frame_shift=0.01) - 1
+    appended = reference_cut.append(cut.truncate(offset=5.0, duration=2.0))
+    feats = appended.load_features()
+    assert feats.shape[0] == appended.num_frames
+    assert feats.min() >= LOG_EPSILON
+
+
+@pytest.mark.parametrize(['combine_fn', 'fold_fn'], [(mix_cuts, mix), (append_cuts, append)])
+def test_combine_cuts_matches_pairwise_fold(combine_fn, fold_fn):
+    cuts = [
+        dummy_cut(0, duration=1.5),
+        dummy_cut(1, duration=2.0).mix(dummy_cut(2, duration=1.0), offset_other_by=0.5, snr=10),
+        dummy_cut(3, duration=0.75),
+        dummy_cut(4, duration=3.0),
+    ]
+    combined = combine_fn(cuts)
+    folded = reduce(fold_fn, cuts)
+    assert isinstance(combined, MixedCut)
+    assert combined.tracks == folded.tracks
+    assert combined.duration == folded.duration
+
+
+@pytest.mark.parametrize('combine_fn', [mix_cuts, append_cuts])
+def test_combine_single_cut_returns_the_cut(combine_fn):
+    cut = dummy_cut(0)
+    assert combine_fn([cut]) is cut
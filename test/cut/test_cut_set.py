@@ -1,6 +1,8 @@
 import pickle
 from tempfile import NamedTemporaryFile
+from unittest.mock import patch
 
+import numpy as np
 import pytest
 
 from lhotse import Features, Recording, SupervisionSegment
@@ -45,6 +47,26 @@ def test_cut_set_holds_both_simple_and_mixed_cuts(cut_set_with_mixed_cut):
     assert len(mixed_cuts) == 1
 
 
+def test_cut_set_partitions_are_computed_once(cut_set_with_mixed_cut):
+    with patch.object(CutSet, '_partition_cuts', wraps=cut_set_with_mixed_cut._partition_cuts) as partition:
+        assert cut_set_with_mixed_cut.mixed_cuts == cut_set_with_mixed_cut.mixed_cuts
+        assert cut_set_with_mixed_cut.simple_cuts == cut_set_with_mixed_cut.simple_cuts
+    partition.assert_called_once()
+    # The cached partitions do not affect the comparison of CutSets.
+    assert cut_set_with_mixed_cut == CutSet(cuts=dict(cut_set_with_mixed_cut.cuts))
+
+def test_cut_set_partitions_are_read_only(cut_set_with_mixed_cut):
+    mixed_cut_id = next(iter(cut_set_with_mixed_cut.mixed_cuts))
+    with pytest.raises(AttributeError):
+        cut_set_with_mixed_cut.mixed_cuts.pop(mixed_cut_id)
+    with pytest.raises(TypeError):
+        del cut_set_with_mixed_cut.mixed_cuts[mixed_cut_id]
+    with pytest.raises(TypeError):
+        cut_set_with_mixed_cut.simple_cuts['new-id'] = cut_set_with_mixed_cut.mixed_cuts[mixed_cut_id]
+    assert len(cut_set_with_mixed_cut.mixed_cuts) == 1
+    assert len(cut_set_with_mixed_cut.simple_cuts) == 2
+
+
 @pytest.mark.parametrize(
     ['format', 'compressed'],
     [
@@ -52,6 +74,8 @@ def test_cut_set_holds_both_simple_and_mixed_cuts(cut_set_with_mixed_cut):
         ('yaml', True),
         ('json', False),
         ('json', True),
+        ('jsonl', False),
+        ('jsonl', True),
     ]
 )
 def test_simple_cut_set_serialization(cut_set, format, compressed):
@@ -62,6 +86,9 @@ def test_simple_cut_set_serialization(cut_set, format, compressed):
         if format == 'json':
             cut_set.to_json(f.name)
             restored = CutSet.from_json(f.name)
+        if format == 'jsonl':
+            cut_set.to_jsonl(f.name)
+            restored = CutSet.from_jsonl(f.name)
     assert cut_set == restored
 
 
@@ -72,6 +99,8 @@ def test_simple_cut_set_serialization(cut_set, format, compressed):
         ('yaml', True),
         ('json', False),
         ('json', True),
+        ('jsonl', False),
+        ('jsonl', True),
     ]
 )
 def test_mixed_cut_set_serialization(cut_set_with_mixed_cut, format, compressed):
@@ -82,6 +111,9 @@ def test_mixed_cut_set_serialization(cut_set_with_mixed_cut, format, compressed)
         if format == 'json':
             cut_set_with_mixed_cut.to_json(f.name)
             restored = CutSet.from_json(f.name)
+        if format == 'jsonl':
+            cut_set_with_mixed_cut.to_jsonl(f.name)
+            restored = CutSet.from_jsonl(f.name)
     assert cut_set_with_mixed_cut == restored
 
 
@@ -254,6 +286,26 @@ def test_mix_same_recording_channels():
     assert cut.tracks[1].cut == cut_set[1]
 
 
+def test_mix_same_recording_channels_sorts_tracks_by_channel():
+    recording = Recording('rec', sampling_rate=8000, num_samples=30 * 8000, duration=30, sources=[
+        AudioSource('file', channels=[0], source='irrelevant1.wav'),
+        AudioSource('file', channels=[1], source='irrelevant2.wav')
+    ])
+    cut_set = CutSet.from_cuts([
+        Cut('cut2', start=0, duration=30, channel=1, recording=recording),
+        Cut('cut1', start=0, duration=30, channel=0, recording=recording),
+        Cut('cut3', start=0, duration=10, channel=1, recording=recording),
+    ])
+
+    mixed = cut_set.mix_same_recording_channels()
+    assert len(mixed) == 2
+
+    cut = mixed[0]
+    assert isinstance(cut, MixedCut)
+    assert [t.cut.channel for t in cut.tracks] == [0, 1]
+    assert mixed[1] == cut_set['cut3']
+
+
 def test_cut_set_filter_supervisions(cut_set):
 
     def get_supervision_ids(cutset):
@@ -284,3 +336,20 @@ def test_compute_cmvn_stats():
     assert stats['norm_stds'].shape == (cut_set[0].num_features,)
     assert (stats['norm_means'] == read_stats['norm_means']).all()
     assert (stats['norm_stds'] == read_stats['norm_stds']).all()
+
+
+@pytest.mark.parametrize(['num_workers', 'buffer_size'], [(1, 1), (2, 3), (4, 16)])
+def test_cut_set_prefetch(num_workers, buffer_size):
+    cut_set = CutSet.from_json('test/fixtures/libri/cuts.json').cut_into_windows(duration=2.0)
+    prefetched = list(cut_set.prefetch(num_workers=num_workers, buffer_size=buffer_size))
+    assert [cut for cut, _ in prefetched] == list(cut_set)
+    for cut, feats in prefetched:
+        np.testing.assert_array_equal(feats, cut.load_features())
+
+
+def test_cut_set_prefetch_stops_early():
+    cut_set = CutSet.from_json('test/fixtures/libri/cuts.json').cut_into_windows(duration=2.0)
+    for idx, (cut, feats) in enumerate(cut_set.prefetch(num_workers=2, buffer_size=2)):
+        assert cut == cut_set[idx]
+        if idx == 1:
+            break
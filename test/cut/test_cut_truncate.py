@@ -1,3 +1,4 @@
+import random
 from math import isclose
 
 import pytest
@@ -6,6 +7,7 @@ from lhotse.cut import Cut, MixTrack, MixedCut
 from lhotse.features import Features
 from lhotse.supervision import SupervisionSegment
 from lhotse.testing.dummies import dummy_cut
+from lhotse.utils import TimeSpan, overlaps, overspans
 
 
 @pytest.fixture
@@ -84,6 +86,39 @@ def test_truncate_cut(
     assert isclose(truncated_cut.end, expected_end)
 
 
+@pytest.mark.parametrize('keep_excessive_supervisions', [True, False])
+def test_truncate_cut_with_many_supervisions_matches_full_scan(keep_excessive_supervisions):
+    rng = random.Random(0)
+    supervisions = [
+        SupervisionSegment(
+            id=f'sup-{idx}',
+            recording_id='irrelevant',
+            start=round(rng.uniform(-5, 600), 3),
+            duration=round(rng.choice([0.0, rng.uniform(0.01, 20)]), 3)
+        )
+        for idx in range(1000)
+    ]
+    cut = dummy_cut('cut', duration=600.0, supervisions=supervisions)
+    criterion = overlaps if keep_excessive_supervisions else overspans
+    for _ in range(50):
+        offset = round(rng.uniform(0, 590), 2)
+        duration = rng.choice([None, round(rng.uniform(0.01, 30), 2)])
+        truncated_cut = cut.truncate(
+            offset=offset,
+            duration=duration,
+            keep_excessive_supervisions=keep_excessive_supervisions
+        )
+        new_time_span = TimeSpan(start=0, end=truncated_cut.duration)
+        expected = sorted(
+            (
+                segment for segment in (s.with_offset(-offset) for s in cut.supervisions)
+                if criterion(new_time_span, segment)
+            ),
+            key=lambda s: s.start
+        )
+        assert truncated_cut.supervisions == expected
+
+
 def test_truncate_above_duration_has_no_effect(overlapping_supervisions_cut):
     truncated_cut = overlapping_supervisions_cut.truncate(duration=1.0, preserve_id=True)
     assert truncated_cut == overlapping_supervisions_cut
@@ -11,9 +11,10 @@ from lhotse.audio import RecordingSet
 from lhotse.augmentation import WavAugmenter, is_wav_augment_available
 from lhotse.features import (Fbank, FeatureExtractor, FeatureMixer, FeatureSet, FeatureSetBuilder, Features, Mfcc,
                              Spectrogram, create_default_feature_extractor)
-from lhotse.features.io import LilcomFilesWriter, LilcomHdf5Writer, NumpyFilesWriter, NumpyHdf5Writer
+from lhotse.features.io import (LilcomFilesWriter, LilcomHdf5Writer, NumpyFilesReader, NumpyFilesWriter,
+                               NumpyHdf5Writer, close_cached_file_handles)
 from lhotse.testing.dummies import DummyManifest
-from lhotse.utils import Seconds, time_diff_to_num_frames
+from lhotse.utils import EPSILON, Seconds, time_diff_to_num_frames
 from lhotse.utils import nullcontext as does_not_raise
 
 other_params = {}
@@ -60,6 +61,8 @@ def test_feature_extractor_generic_deserialization():
         ('yaml', True),
         ('json', False),
         ('json', True),
+        ('jsonl', False),
+        ('jsonl', True),
     ]
 )
 def test_feature_set_serialization(format, compressed):
@@ -87,6 +90,9 @@ def test_feature_set_serialization(format, compressed):
         if format == 'yaml':
             feature_set.to_yaml(f.name)
             feature_set_deserialized = FeatureSet.from_yaml(f.name)
+        if format == 'jsonl':
+            feature_set.to_jsonl(f.name)
+            feature_set_deserialized = FeatureSet.from_jsonl(f.name)
     assert feature_set_deserialized == feature_set
 
 
@@ -153,7 +159,9 @@ def test_compute_global_stats():
         LilcomFilesWriter(TemporaryDirectory().name),
         LilcomHdf5Writer(NamedTemporaryFile().name),
         NumpyFilesWriter(TemporaryDirectory().name),
-        NumpyHdf5Writer(NamedTemporaryFile().name)
+        NumpyHdf5Writer(NamedTemporaryFile().name),
+        NumpyFilesWriter(TemporaryDirectory().name, dtype='float16'),
+        NumpyHdf5Writer(NamedTemporaryFile().name, dtype='float16'),
     ]
 )
 def test_feature_set_builder(storage):
@@ -182,6 +190,7 @@ def test_feature_set_builder(storage):
         assert features.storage_type == storage.name
         # assert that the metadata is consistent with the data shapes
         arr = features.load()
+        assert arr.dtype == np.float32
         assert arr.shape[0] == features.num_frames
         assert arr.shape[1] == features.num_features
         # assert that the stored features are the same as the "freshly extracted" features
@@ -203,6 +212,23 @@ def test_feature_set_builder(storage):
         assert features.duration == 1.0
 
 
+def test_numpy_files_reader_reads_a_writable_subset():
+    arr = np.random.randn(100, 40).astype(np.float32)
+    with TemporaryDirectory() as d:
+        key = NumpyFilesWriter(d).write('abcdef', arr)
+        reader = NumpyFilesReader(d)
+        subset = reader.read(key, left_offset_frames=10, right_offset_frames=-5)
+        close_cached_file_handles()
+    np.testing.assert_array_equal(subset, arr[10:-5])
+    assert not isinstance(subset, np.memmap)
+    assert subset.flags.writeable
+
+
+def test_numpy_writer_rejects_unsupported_storage_dtype():
+    with TemporaryDirectory() as d, raises(ValueError):
+        NumpyFilesWriter(d, dtype='int8')
+
+
 @pytest.mark.skipif(not is_wav_augment_available(), reason='WavAugment required')
 def test_feature_set_builder_with_augmentation():
     recordings: RecordingSet = RecordingSet.from_json('test/fixtures/audio.json')
@@ -305,6 +331,31 @@ def test_mixer(feature_extractor, decimal, exception_expectation):
         assert mixer.unmixed_feats.shape == (2, 100, feature_extractor.feature_dim(sampling_rate=8000))
 
 
+@pytest.mark.parametrize('feature_extractor', [Fbank(), Spectrogram()])
+def test_mixer_with_offset_and_snr_matches_energy_domain_mix(feature_extractor):
+    rng = np.random.RandomState(0)
+    f1 = rng.randn(100, 40).astype(np.float32)
+    f2 = rng.randn(50, 40).astype(np.float32)
+    mixer = FeatureMixer(
+        feature_extractor=feature_extractor,
+        base_feats=f1,
+        frame_shift=0.01,
+    )
+    mixer.add_to_mix(f2, snr=10, offset=0.8)
+
+    gain = mixer.gains[0]
+    f2_padded = np.full((130, 40), -1000.0, dtype=np.float32)
+    f2_padded[80:] = f2
+    f1_padded = np.full((130, 40), -1000.0, dtype=np.float32)
+    f1_padded[:100] = f1
+    expected = np.log(np.maximum(EPSILON, np.exp(f1_padded) + gain * np.exp(f2_padded)))
+
+    mixed = mixer.mixed_feats
+    assert mixed.dtype == np.float32
+    np.testing.assert_almost_equal(mixed, expected, decimal=4)
+    assert mixer.unmixed_feats.shape == (2, 130, 40)
+
+
 def test_feature_set_prefix_path():
     features = FeatureSet.from_features([
         Features(
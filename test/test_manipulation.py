@@ -1,3 +1,6 @@
+from tempfile import NamedTemporaryFile
+from unittest.mock import patch
+
 from lhotse.utils import nullcontext as does_not_raise
 
 import pytest
@@ -5,6 +8,7 @@ from pytest import mark, raises
 
 from lhotse import CutSet
 from lhotse.audio import RecordingSet
+from lhotse.cut import PaddingCut
 from lhotse.features import FeatureSet
 from lhotse.manipulation import combine, load_manifest
 from lhotse.supervision import SupervisionSet
@@ -66,6 +70,52 @@ def test_combine(manifest_type):
     assert combined_iterable == expected
 
 
+def test_combine_cut_sets_starting_with_padding_cut():
+    padding_cut = PaddingCut('padding', duration=10.0, sampling_rate=16000, use_log_energy=True, num_frames=1000,
+                             num_features=40, num_samples=160000)
+    combined = combine(CutSet.from_cuts([padding_cut]), DummyManifest(CutSet, begin_id=0, end_id=1))
+    assert isinstance(combined, CutSet)
+    assert len(combined) == 2
+    assert combined[0] == padding_cut
+
+
+def test_combine_cut_sets_with_conflicting_ids_raises():
+    with pytest.raises(AssertionError):
+        combine(
+            DummyManifest(CutSet, begin_id=0, end_id=10),
+            DummyManifest(CutSet, begin_id=5, end_id=15),
+        )
+
+
+@mark.parametrize('manifest_type', [RecordingSet, SupervisionSet, FeatureSet, CutSet])
+def test_combine_empty_manifests(manifest_type):
+    empty = DummyManifest(manifest_type, begin_id=0, end_id=0)
+    combined = combine(empty, DummyManifest(manifest_type, begin_id=0, end_id=0))
+    assert isinstance(combined, manifest_type)
+    assert len(combined) == 0
+
+
+@mark.parametrize('manifest_type', [RecordingSet, SupervisionSet, FeatureSet, CutSet])
+@mark.parametrize('suffix', ['.jsonl', '.jsonl.gz'])
+def test_load_jsonl_manifest(manifest_type, suffix):
+    manifest = DummyManifest(manifest_type, begin_id=0, end_id=10)
+    with NamedTemporaryFile(suffix=suffix) as f:
+        manifest.to_jsonl(f.name)
+        restored = load_manifest(f.name)
+    assert isinstance(restored, manifest_type)
+    assert restored == manifest
+
+
+@mark.parametrize('manifest_type', [RecordingSet, SupervisionSet, FeatureSet, CutSet])
+def test_to_jsonl_does_not_materialize_all_dicts(manifest_type):
+    manifest = DummyManifest(manifest_type, begin_id=0, end_id=10)
+    with patch.object(manifest_type, 'to_dicts', side_effect=AssertionError('to_jsonl() should stream the items.')), \
+            NamedTemporaryFile(suffix='.jsonl') as f:
+        manifest.to_jsonl(f.name)
+        restored = manifest_type.from_jsonl(f.name)
+    assert restored == manifest
+
+
 @mark.parametrize(
     ['path', 'exception_expectation'],
     [
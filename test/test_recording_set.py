@@ -60,6 +60,8 @@ def test_get_metadata(recording_set):
         ('yaml', True),
         ('json', False),
         ('json', True),
+        ('jsonl', False),
+        ('jsonl', True),
     ]
 )
 def test_serialization(format, compressed):
@@ -90,6 +92,9 @@ def test_serialization(format, compressed):
         if format == 'json':
             recording_set.to_json(f.name)
             deserialized = RecordingSet.from_json(f.name)
+        if format == 'jsonl':
+            recording_set.to_jsonl(f.name)
+            deserialized = RecordingSet.from_jsonl(f.name)
     assert deserialized == recording_set
 
 
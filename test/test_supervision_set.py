@@ -1,3 +1,4 @@
+import random
 from tempfile import NamedTemporaryFile
 
 import pytest
@@ -86,6 +87,8 @@ def test_supervision_set_iteration():
         ('yaml', True),
         ('json', False),
         ('json', True),
+        ('jsonl', False),
+        ('jsonl', True),
     ]
 )
 def test_supervision_set_serialization(format, compressed):
@@ -109,6 +112,9 @@ def test_supervision_set_serialization(format, compressed):
         if format == 'json':
             supervision_set.to_json(f.name)
             restored = supervision_set.from_json(f.name)
+        if format == 'jsonl':
+            supervision_set.to_jsonl(f.name)
+            restored = supervision_set.from_jsonl(f.name)
     assert supervision_set == restored
 
 
@@ -222,3 +228,39 @@ def test_supervision_trim_does_not_affect_nonnegative_start(supervision, start):
 def test_supervision_is_hashable(supervision):
     # Check that we can create a dict with the supervision object as the key.
     d = {supervision: supervision.duration}
+
+
+def test_supervision_set_find_matches_linear_scan():
+    rng = random.Random(0)
+    segments = [
+        SupervisionSegment(
+            id=f's{idx}',
+            recording_id=rng.choice(['r1', 'r2']),
+            start=round(rng.uniform(0, 100), 2),
+            duration=round(rng.uniform(0.1, 10), 2),
+            channel=rng.choice([0, 1])
+        )
+        for idx in range(500)
+    ]
+    supervision_set = SupervisionSet.from_segments(segments)
+    for _ in range(100):
+        recording_id, channel = rng.choice(['r1', 'r2']), rng.choice([None, 0, 1])
+        start_after = round(rng.uniform(0, 80), 2)
+        end_before = rng.choice([None, start_after + round(rng.uniform(0, 30), 2)])
+        expected = sorted(
+            (
+                seg for seg in segments
+                if seg.recording_id == recording_id
+                   and (channel is None or seg.channel == channel)
+                   and seg.start >= start_after
+                   and (end_before is None or seg.end <= end_before)
+            ),
+            key=lambda seg: seg.start
+        )
+        found = list(supervision_set.find(
+            recording_id=recording_id,
+            channel=channel,
+            start_after=start_after,
+            end_before=end_before
+        ))
+        assert found == expected
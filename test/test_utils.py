@@ -1,9 +1,15 @@
+import math
+from dataclasses import asdict, dataclass, field
 from pathlib import Path
 from tempfile import NamedTemporaryFile
+from typing import Any, Dict, List, Optional
 
+import numpy as np
 import pytest
 
-from lhotse.utils import TimeSpan, load_yaml, overlaps, overspans, save_to_yaml, save_to_json, load_json
+from lhotse.audio import AudioSource, Recording, RecordingSet
+from lhotse.utils import (TimeSpan, asdict_nonull, fastcopy, fix_random_seed, fresh_id, load_json, load_jsonl,
+                          load_yaml, overlaps, overspans, save_to_json, save_to_jsonl, save_to_yaml)
 
 
 @pytest.mark.parametrize(
@@ -72,3 +78,119 @@ def test_json_save_load_roundtrip(extension):
         f.flush()
         data_deserialized = load_json(path)
     assert data == data_deserialized
+
+
+@pytest.fixture(params=['orjson', 'json'])
+def jsonl_backend(request, monkeypatch):
+    """Run the test with JSON Lines (de)serialization done by orjson, and by the standard json module."""
+    if request.param == 'orjson':
+        pytest.importorskip('orjson')
+    else:
+        monkeypatch.setattr('lhotse.utils.orjson', None)
+    return request.param
+
+
+@pytest.mark.parametrize('extension', ['.jsonl', '.jsonl.gz'])
+def test_jsonl_save_load_roundtrip(extension, jsonl_backend):
+    data = [{'some': ['data'], 'number': 0.1}, {'other': 'data', 'nested': {'a': [1, 2, 3]}}]
+    with NamedTemporaryFile() as f:
+        path = Path(f.name).with_suffix(extension)
+        save_to_jsonl(data, path)
+        f.flush()
+        data_deserialized = list(load_jsonl(path))
+    assert data == data_deserialized
+
+
+def test_jsonl_manifest_with_numpy_scalars_roundtrip(jsonl_backend):
+    recording_set = RecordingSet.from_recordings([
+        Recording(
+            id='rec',
+            sources=[AudioSource(type='file', channels=[0], source='irrelevant.wav')],
+            sampling_rate=8000,
+            num_samples=np.int64(8000),
+            duration=np.int64(8000) / 8000
+        )
+    ])
+    with NamedTemporaryFile(suffix='.jsonl') as f:
+        recording_set.to_jsonl(f.name)
+        restored = RecordingSet.from_jsonl(f.name)
+    assert restored == recording_set
+    assert type(restored['rec'].duration) is float
+
+
+def test_jsonl_non_finite_floats_do_not_depend_on_orjson(jsonl_backend):
+    data = [{'nan': float('nan'), 'values': [float('inf'), -np.inf]}, {'missing': None}]
+    with NamedTemporaryFile(suffix='.jsonl') as f:
+        save_to_jsonl(data, f.name)
+        lines = Path(f.name).read_text().splitlines()
+        data_deserialized = list(load_jsonl(f.name))
+    # The non-finite values are written in the same way as the standard json module does it, not as null.
+    assert 'null' not in lines[0]
+    assert 'NaN' in lines[0] and '-Infinity' in lines[0]
+    assert 'null' in lines[1]
+    assert math.isnan(data_deserialized[0]['nan'])
+    assert data_deserialized[0]['values'] == [float('inf'), float('-inf')]
+    assert data_deserialized[1] == {'missing': None}
+
+
+def test_fresh_id():
+    ids = [fresh_id() for _ in range(100)]
+    assert all(len(id_) == 32 for id_ in ids)
+    assert all(int(id_, base=16) >= 0 for id_ in ids)
+    assert len(set(ids)) == len(ids)
+
+
+def test_fresh_id_is_deterministic_with_fixed_seed(monkeypatch):
+    # Ensure the global ID generator is restored after the test.
+    monkeypatch.setattr('lhotse.utils._lhotse_uuid', None)
+    fix_random_seed(0)
+    first = [fresh_id() for _ in range(5)]
+    fix_random_seed(0)
+    second = [fresh_id() for _ in range(5)]
+    assert first == second
+
+
+def test_fastcopy_dataclass_with_slots():
+    span = TimeSpan(start=5, end=10)
+    assert not hasattr(span, '__dict__')
+    copied = fastcopy(span, end=12)
+    assert copied == TimeSpan(start=5, end=12)
+    assert span == TimeSpan(start=5, end=10)
+
+
+@dataclass
+class _Inner:
+    value: int
+    missing: Optional[str] = None
+
+
+@dataclass
+class _Outer:
+    name: str
+    inner: _Inner
+    items: List[_Inner] = field(default_factory=list)
+    custom: Dict[str, Any] = field(default_factory=dict)
+    missing: Optional[_Inner] = None
+
+
+def test_asdict_nonull():
+    obj = _Outer(
+        name='outer',
+        inner=_Inner(1),
+        items=[_Inner(2, missing='present'), _Inner(3)],
+        custom={'keeps-null': None, 'nested': [1, (2, 3)]}
+    )
+    serialized = asdict_nonull(obj)
+    assert serialized == {
+        'name': 'outer',
+        'inner': {'value': 1},
+        'items': [{'value': 2, 'missing': 'present'}, {'value': 3}],
+        'custom': {'keeps-null': None, 'nested': [1, (2, 3)]},
+    }
+    # Apart from the removed null fields, the result is the same as the one from dataclasses.asdict()
+    expected = asdict(obj)
+    del expected['missing'], expected['inner']['missing'], expected['items'][1]['missing']
+    assert serialized == expected
+    # The containers are copied, not shared with the original object.
+    assert serialized['custom'] is not obj.custom
+    assert serialized['custom']['nested'] is not obj.custom['nested']